@@ -1,18 +1,47 @@
 # -*- coding: utf-8 -*-
 """Adds VocaDB search support to Beets
 """
+from beets import config
 from beets.autotag.hooks import AlbumInfo, TrackInfo, Distance
 from beets.plugins import BeetsPlugin
-from beetsplug import lastgenre
-import requests
+from collections import OrderedDict
+from datetime import timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
 import re
+import threading
+
+# Prefer orjson for decoding API responses; it parses the raw bytes
+# directly and is considerably faster than the standard library.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# How long cached search results stay fresh, in seconds. Album and track
+# metadata rarely changes and is kept for `cache_days`, but searches should
+# pick up new releases.
+SEARCH_CACHE_EXPIRY = 60 * 60
+
+# Number of converted albums kept in memory for the life of the process.
+ALBUM_INFO_CACHE_SIZE = 500
+
+# (connect, read) timeouts for API requests, in seconds, so a stalled
+# server can't hang the import.
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Patterns used to clean up album-name queries before searching.
+NON_WORD_RE = re.compile(r'\W+', re.UNICODE)
+MEDIUM_RE = re.compile(r'\b(?:CD|disc)\s*\d+', re.IGNORECASE)
 
 
 class VocaDBPlugin(BeetsPlugin):
     def __init__(self):
         super(VocaDBPlugin, self).__init__()
-        self.base_url = 'http://vocadb.net'
-        self.lg = lastgenre.LastGenrePlugin()
+        self.base_url = 'https://vocadb.net'
+        self._lg = None
+        # Genres can be resolved from worker threads; only one may build lg.
+        self._lg_lock = threading.Lock()
         self.config.add({
             'source_weight': 0.5,
             'canonical_artists': True,
@@ -21,18 +50,157 @@ class VocaDBPlugin(BeetsPlugin):
             'artist_priority': ['producers', 'circles'],
             'circles_exclude': [],
             'genres': True,
+            'cache': True,
+            'cache_days': 7,
             'lang-priority': ''  # 'Japanese, Romaji, English'
         })
         self._log.debug('Querying VocaDB')
-        self.lang = self.config['lang-priority'].get().split(',')
+        # Resolve the options used on every lookup once, rather than going
+        # through the config views for each album and track.
+        self.source_weight = self.config['source_weight'].as_number()
+        self.canonical_artists = self.config['canonical_artists'].get()
+        self.separator = self.config['separator'].get()
+        self.whitelist = self.config['whitelist'].get()
+        self.artist_priority = self.config['artist_priority'].as_str_seq()
+        self.circles_exclude = set(self.config['circles_exclude'].as_str_seq())
+        self._session = None
+        self._cached = False
+        # Requests currently on the wire, so concurrent callers asking for
+        # the same resource wait for one response instead of sending another.
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self.lang = [lang.strip() for lang in
+                     self.config['lang-priority'].get().split(',')
+                     if lang.strip()]
+        # Translated names are only used to honour lang-priority, so don't
+        # ask the API for them otherwise; they can double the response size.
+        self._want_names = any(lang != 'Default' for lang in self.lang)
+        # Language the API is asked to localize names in
+        self.api_lang = self.lang[0] if self.lang else 'Default'
+        # AlbumInfo objects already built this run, most recently used last.
+        # Candidates are converted from worker threads, hence the lock.
+        self._album_infos = OrderedDict()
+        self._album_infos_lock = threading.Lock()
         if self.config['genres'].get():
             self.import_stages = [self.imported]
 
+    @property
+    def lg(self):
+        """The lastgenre plugin used to resolve tags against its whitelist.
+
+        Loading it reads the genre whitelist and tree, so that only happens
+        once genres are actually being resolved.
+        """
+        if self._lg is None:
+            with self._lg_lock:
+                if self._lg is None:
+                    from beetsplug import lastgenre
+                    self._lg = lastgenre.LastGenrePlugin()
+        return self._lg
+
+    @property
+    def session(self):
+        """The HTTP session shared by all API requests.
+
+        It is built on first use, so beets commands that never query VocaDB
+        don't pay for importing requests (or requests-cache) or opening the
+        cache database.
+        """
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            try:
+                import requests_cache
+            except ImportError:
+                requests_cache = None
+
+            # Share one pooled session so every request after the first
+            # reuses an open connection instead of paying for a new
+            # handshake. When requests-cache is available, responses are
+            # also kept on disk so re-importing a release doesn't hit the
+            # network at all, and are served stale if VocaDB is unreachable.
+            self._cached = (requests_cache is not None and
+                            self.config['cache'].get())
+            if self._cached:
+                session = requests_cache.CachedSession(
+                    os.path.join(config.config_dir(), 'vocadb_cache'),
+                    backend='sqlite',
+                    expire_after=timedelta(
+                        days=self.config['cache_days'].as_number()),
+                    allowable_methods=('GET',), stale_if_error=True)
+            else:
+                session = requests.Session()
+            session.headers['Accept'] = 'application/json'
+            # Retry transient gateway errors with a short backoff.
+            retries = Retry(total=2, backoff_factor=0.3,
+                            status_forcelist=[502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                  max_retries=retries)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._session = session
+        return self._session
+
+    @property
+    def _request_error(self):
+        """The base class of errors raised by requests, imported lazily like
+        the session. Only evaluated once an exception is being matched.
+        """
+        import requests
+        return requests.RequestException
+
+    def _get_json(self, path, params, expire_after=None):
+        """Fetch an API path and return the decoded JSON response.
+        `expire_after` overrides the default cache lifetime when caching is
+        enabled. Raises `requests.RequestException` on HTTP errors and
+        `ValueError` if the body is not valid JSON.
+
+        If an identical request is already in progress on another thread,
+        wait for its result rather than issuing a duplicate.
+        """
+        key = (path, tuple(sorted(params.items())))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                owner = False
+            else:
+                owner = True
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._request_json(path, params, expire_after)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _request_json(self, path, params, expire_after):
+        """Perform the GET request behind `_get_json`."""
+        session = self.session
+        kwargs = {'params': params, 'timeout': REQUEST_TIMEOUT}
+        if self._cached and expire_after is not None:
+            kwargs['expire_after'] = expire_after
+        r = session.get(self.base_url + path, **kwargs)
+        r.raise_for_status()
+        return json_loads(r.content)
+
+    def _fields(self, fields):
+        """Return an API `fields` value, adding `Names` when needed."""
+        return fields + ',Names' if self._want_names else fields
+
     def album_distance(self, items, album_info, mapping):
         """Returns the album distance."""
         dist = Distance()
         if album_info.data_source == 'VocaDB':
-            dist.add('source', self.config['source_weight'].as_number())
+            dist.add('source', self.source_weight)
         return dist
 
     def candidates(self, items, artist, album, va_likely):
@@ -41,8 +209,8 @@ class VocaDBPlugin(BeetsPlugin):
         query = album
         try:
             return self.get_albums(query, va_likely)
-        except:
-            self._log.debug('VocaDB Search Error: (query: %s)' % query)
+        except (self._request_error, ValueError, KeyError) as e:
+            self._log.debug('VocaDB Search Error: %s (query: %s)' % (e, query))
             return []
 
     def get_albums(self, query, va_likely):
@@ -52,117 +220,143 @@ class VocaDBPlugin(BeetsPlugin):
         # cause a query to return no results, even if they match the artist or
         # album title. Use `re.UNICODE` flag to avoid stripping non-english
         # word characters.
-        query = re.sub(r'(?u)\W+', ' ', query)
+        query = NON_WORD_RE.sub(' ', query)
         # Strip medium information from query, Things like "CD1" and "disk 1"
         # can also negate an otherwise positive result.
-        query = re.sub(r'(?i)\b(CD|disc)\s*\d+', '', query)
-
-        lang = self.lang[0] or 'Default'
+        query = MEDIUM_RE.sub('', query).strip()
+        # Nothing left to search for (e.g. the album was just "CD1")
+        if not query:
+            return []
 
         # Query VocaDB
-        r = requests.get(self.base_url + '/api/albums?nameMatchMode=Auto' +
-                         '&preferAccurateMatches=true' +
-                         '&fields=Names,Artists,Discs' +
-                         '&query=%s&lang=%s' % (query, lang),
-                         headers={'Accept': 'application/json'})
-
-        # Decode reponse content
         try:
-            item = r.json()
-        except:
-            self._log.debug('VocaDB JSON Decode Error: (query: %s)' % query)
+            item = self._get_json('/api/albums', {
+                'nameMatchMode': 'Auto',
+                'preferAccurateMatches': 'true',
+                'fields': self._fields('Artists,Discs'),
+                'query': query,
+                'lang': self.api_lang,
+            }, expire_after=SEARCH_CACHE_EXPIRY)
+        except (self._request_error, ValueError) as e:
+            self._log.debug('VocaDB Request Error: %s (query: %s)' % (e, query))
             return []
 
         self._log.debug('get_albums Querying VocaDB for release %s' % query)
-        return [self.get_album_info(album) for album in item['items']]
+        # Each candidate needs its own tracks request; run them concurrently
+        # so the search costs roughly one round-trip instead of one per album.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            albums = executor.map(self.get_album_info, item['items'])
+            return [album for album in albums if album is not None]
 
     def item_candidates(self, item, artist, album):
         return []
 
     def album_for_id(self, album_id):
-        lang = self.lang[0] or 'Default'
-        r = requests.get(self.base_url + '/api/albums/%s?fields=Names,Artists,Discs&lang=%s' % (str(album_id), lang),
-                         headers={'Accept': 'application/json'})
         try:
-            item = r.json()
-        except:
-            self._log.debug('VocaDB JSON Decode Error: (id: %s)' % album_id)
+            album_id = int(album_id)
+        except (TypeError, ValueError):
+            # Not a VocaDB ID (e.g. a MusicBrainz release ID)
+            return None
+
+        # An album converted earlier in this run needs no request at all
+        album_info = self._cached_album_info((album_id, self.api_lang))
+        if album_info is not None:
+            return album_info
+
+        try:
+            item = self._get_json('/api/albums/%s' % album_id, {
+                'fields': self._fields('Artists,Discs,Tracks'),
+                'songFields': self._fields('Artists'),
+                'lang': self.api_lang,
+            })
+        except (self._request_error, ValueError) as e:
+            self._log.debug('VocaDB Request Error: %s (id: %s)' % (e, album_id))
             return None
 
         return self.get_album_info(item)
 
     def tracks_for_album_id(self, album_id):
-        lang = self.lang[0] or 'Default'
-        r = requests.get(self.base_url + '/api/albums/%d/tracks?fields=Names,Artists&lang=%s' % (album_id, lang),
-                         headers={'Accept': 'application/json'})
         try:
-            tracks = r.json()
-        except:
-            self._log.debug('VocaDB JSON Decode Error: (id: %s)' % album_id)
+            tracks = self._get_json('/api/albums/%d/tracks' % album_id, {
+                'fields': self._fields('Artists'),
+                'lang': self.api_lang,
+            })
+        except (self._request_error, ValueError) as e:
+            self._log.debug('VocaDB Request Error: %s (id: %s)' % (e, album_id))
             return None
 
         return [self.get_track_info(track) for track in tracks]
 
     def get_preferred_name(self, item):
         """Retrieve the item's name in the preferred language."""
-        item_name = ''
-        if self.lang and self.lang[0] and 'names' in item:
-            for lang in self.lang:          # for our list of preferred languages
-                for name in item['names']:  # loop through the list of names
-                    if name['language'] == lang:  # and check if it matches
-                        language = name['language']
-                        item_name = name['value']
-                        break
-                if item_name:
-                    break
+        if self.lang and 'names' in item:
+            # index the names by language once, then walk our preferences
+            names = {name['language']: name['value'] for name in item['names']}
+            for lang in self.lang:
+                if names.get(lang):
+                    return (names[lang], lang)
 
         # if there was no matching name for the preferred languages
-        if not item_name:
-            language = item['defaultNameLanguage']
-            item_name = item['defaultName']
-
-        return (item_name, language)
+        return (item['defaultName'], item['defaultNameLanguage'])
 
     def get_track_info(self, item):
         """"Convert JSON data into a format beets can read."""
         song = item['song']
-        title, _ = self.get_preferred_name(item['song'])
-        track_id = song['id']
-        artist = song['artistString']
-        artist_credit = None
-        artist_id = None
-
-        length = song['lengthSeconds']
-
-        medium = item['discNumber']
-        medium_index = item['trackNumber']
-
-        lyricist = self.config['separator'].get().join(
-            [(_artist['artist']['name'] if 'artist' in _artist else _artist['name'])
-             for _artist in song['artists']
-             if 'Lyricist' in _artist['roles'].split(', ')]
-        ) or None
-
-        composer = self.config['separator'].get().join(
-            [(_artist['artist']['name'] if 'artist' in _artist else _artist['name'])
-             for _artist in song['artists']
-             if 'Composer' in _artist['roles'].split(', ')]
-        ) or None
-
-        arranger = self.config['separator'].get().join(
-            [(_artist['artist']['name'] if 'artist' in _artist else _artist['name'])
-             for _artist in song['artists']
-             if 'Arranger' in _artist['roles'].split(', ')]
-        ) or None
-
-        return TrackInfo(title, track_id, artist=artist, artist_id=artist_id,
-                         length=length, medium=medium,
-                         medium_index=medium_index, medium_total=None,
-                         artist_credit=artist_credit, data_source='VocaDB',
-                         lyricist=lyricist, composer=composer,
-                         arranger=arranger)
+        title, _ = self.get_preferred_name(song)
+
+        # Collect lyricists, composers and arrangers in one pass
+        lyricists = []
+        composers = []
+        arrangers = []
+        for _artist in song['artists']:
+            name = _artist['artist']['name'] if 'artist' in _artist else _artist['name']
+            roles = _artist['roles'].split(', ')
+            if 'Lyricist' in roles:
+                lyricists.append(name)
+            if 'Composer' in roles:
+                composers.append(name)
+            if 'Arranger' in roles:
+                arrangers.append(name)
+
+        lyricist = self.separator.join(lyricists) or None
+        composer = self.separator.join(composers) or None
+        arranger = self.separator.join(arrangers) or None
+
+        return TrackInfo(title, song['id'], artist=song['artistString'],
+                         length=song['lengthSeconds'],
+                         medium=item['discNumber'],
+                         medium_index=item['trackNumber'],
+                         data_source='VocaDB', lyricist=lyricist,
+                         composer=composer, arranger=arranger)
 
     def get_album_info(self, item):
+        """Convert album JSON into an AlbumInfo, reusing the one built
+        earlier in this run for the same album and language if there is one.
+        """
+        key = (item['id'], self.api_lang)
+        album_info = self._cached_album_info(key)
+        if album_info is None:
+            album_info = self._make_album_info(item)
+            if album_info is not None:
+                self._cache_album_info(key, album_info)
+        return album_info
+
+    def _cached_album_info(self, key):
+        """Return the AlbumInfo memoized under `key`, or None."""
+        with self._album_infos_lock:
+            album_info = self._album_infos.get(key)
+            if album_info is not None:
+                self._album_infos.move_to_end(key)
+            return album_info
+
+    def _cache_album_info(self, key, album_info):
+        """Memoize `album_info`, evicting the least recently used entry."""
+        with self._album_infos_lock:
+            self._album_infos[key] = album_info
+            if len(self._album_infos) > ALBUM_INFO_CACHE_SIZE:
+                self._album_infos.popitem(last=False)
+
+    def _make_album_info(self, item):
         """"Convert JSON data into a format beets can read."""
         album_name, language = self.get_preferred_name(item)
         album_id = item['id']
@@ -172,18 +366,31 @@ class VocaDBPlugin(BeetsPlugin):
         artist_credit = None
         va = (artist == 'Various artists' or item['discType'] == 'Compilation') # if compilation
         
+        # Sort the credited artists into producers, circles and the label in
+        # a single pass over the list
+        producers = []
+        circles = []
+        label = None
+        for _artist in item.get('artists', ()):
+            categories = _artist['categories'].split(', ')
+            if label is None and 'Label' in categories:
+                label = _artist['name']
+            if not _artist['isSupport']:
+                if 'Producer' in categories:
+                    producers.append(_artist)
+                if 'Circle' in categories:
+                    circles.append(_artist)
+
         # More detailed artist information
-        if 'artists' in item and not self.config['canonical_artists'].get():
+        if 'artists' in item and not self.canonical_artists:
             orig_artist = artist # the original artist before we start trying to find better ones
             artist_corrected = False
-            producers = [_artist for _artist in item['artists'] if 'Producer' in _artist['categories'].split(', ') and not _artist['isSupport']]
-            circles = [_artist for _artist in item['artists'] if 'Circle' in _artist['categories'].split(', ') and not _artist['isSupport']]
 
-            for val in self.config['artist_priority'].as_str_seq():
+            for val in self.artist_priority:
                 if val == 'circles':
                     for _artist in circles:
                         if 'artist' in _artist:
-                            if (_artist['artist']['name'] in self.config['circles_exclude'].as_str_seq()\
+                            if (_artist['artist']['name'] in self.circles_exclude\
                                 and not len(producers) > 1): # Use a circle, even if it's excluded, when there are multiple primary producers
                                 break
                             
@@ -213,19 +420,23 @@ class VocaDBPlugin(BeetsPlugin):
         day = item['releaseDate']['day'] if 'day' in item['releaseDate'] else None
 
         mediums = 0
-        disctitles = None
+        disctitles = []
 
         if 'discs' in item:
             mediums = len(item['discs'])
-            disctitles = {disc['discNumber']: disc['name'] for disc in item['discs']}
-
-        label = None
-        for _artist in item['artists']:
-            if 'Label' in _artist['categories'].split(', '):
-                label = _artist['name']
-                break
-
-        tracks = self.tracks_for_album_id(album_id)
+            # Disc titles indexed directly by disc number
+            disctitles = [None] * (max((disc['discNumber'] for disc in item['discs']), default=0) + 1)
+            for disc in item['discs']:
+                disctitles[disc['discNumber']] = disc['name']
+
+        # Albums fetched by ID carry their track list inline; search results
+        # don't, so those still need a separate tracks request.
+        if 'tracks' in item:
+            tracks = [self.get_track_info(track) for track in item['tracks']]
+        else:
+            tracks = self.tracks_for_album_id(album_id)
+            if tracks is None:
+                return None
 
         track_index = 1
         for track in tracks:
@@ -233,59 +444,112 @@ class VocaDBPlugin(BeetsPlugin):
                 track_index = track.medium_index
             track.index = track_index
             track_index += 1
-            if disctitles and track.medium and (track.medium in disctitles)\
-               and disctitles[track.medium]:
-                track.disctitle = disctitles[track.medium]
+            medium = track.medium
+            if medium and medium < len(disctitles) and disctitles[medium]:
+                track.disctitle = disctitles[medium]
 
         return AlbumInfo(album_name, album_id, artist, artist_id, tracks,
                          albumtype=albumtype, va=va, year=year, month=month, day=day,
-                         label=label, mediums=mediums, artist_sort=None,
+                         label=label, mediums=mediums,
                          catalognum=catalognum, script='utf-8',  # VocaDB's JSON responses are encoded in UTF-8
-                         language=language, country=None,
+                         language=language,
                          artist_credit=artist_credit, data_source='VocaDB',
                          data_url=(self.base_url + '/albums/%d' % album_id))
 
-    def add_genre_to_item(self, item, is_album):
-        lang = self.lang[0] or 'Default'
-        if is_album:
-            url = self.base_url + '/api/albums/%s?fields=Tags&lang=%s' % (item.mb_albumid, lang)
-        else:
-            url = self.base_url + '/api/songs/%s?fields=Tags&lang=%s' % (item.mb_trackid, lang)
+    def _genre_from_tags(self, tags):
+        """Turn a VocaDB `tags` list into a genre string."""
+        genre = ''
+        if tags:
+            tags = [_tag['tag']['name'].lower() for _tag in tags]
 
-        r = requests.get(url, headers={'Accept': 'application/json'})
+            if self.whitelist:
+                genre = self.lg._resolve_genres(tags)
+            else:
+                genre = self.separator.join(tags)
 
+        return genre
+
+    def get_genre(self, path):
+        """Fetch the tags of a VocaDB album or song and turn them into a
+        genre string. Returns None if the request fails.
+        """
         try:
-            obj = r.json()
-        except:
-            self._log.debug('VocaDB JSON Decode Error: (id: %s)' % item.id)
+            obj = self._get_json(path, {'fields': 'Tags', 'lang': self.api_lang})
+        except (self._request_error, ValueError) as e:
+            self._log.debug('VocaDB Request Error: %s (path: %s)' % (e, path))
             return None
 
-        # Try to find the tags
-        genre = ''
-        if 'tags' in obj and obj['tags']:
-            tags = [_tag['tag']['name'].lower() for _tag in obj['tags']]
+        return self._genre_from_tags(obj.get('tags'))
 
-            if self.config['whitelist'].get():
-                genre = self.lg._resolve_genres(tags)
-            else:
-                genre = self.config['separator'].get().join(tags)
+    def get_track_genres(self, album_id):
+        """Fetch the tags of every song on an album in one request. Returns
+        a dict mapping song IDs (as strings) to genre strings, which is
+        empty if the request fails.
+        """
+        try:
+            tracks = self._get_json('/api/albums/%s/tracks' % album_id,
+                                    {'fields': 'Tags', 'lang': self.api_lang})
+        except (self._request_error, ValueError) as e:
+            self._log.debug('VocaDB Request Error: %s (id: %s)' % (e, album_id))
+            return {}
+
+        return {str(track['song']['id']):
+                self._genre_from_tags(track['song'].get('tags'))
+                for track in tracks if 'song' in track}
+
+    def get_item_genres(self, item, is_album):
+        """Look up the genre of a library item, and of each of its tracks
+        if it is an album. Returns a list of (item, genre) pairs for the
+        lookups that succeeded.
+        """
+        if is_album:
+            path = '/api/albums/%s' % item.mb_albumid
+        else:
+            path = '/api/songs/%s' % item.mb_trackid
 
-        item.genre = genre
-        item.store()
+        genre = self.get_genre(path)
+        if genre is None:
+            return []
+
+        updates = [(item, genre)]
 
         if is_album:
-            for track in item.items():
-                self.add_genre_to_item(track, False)
+            # The album's track list carries the tags of all its songs, so
+            # one request usually covers every track. Anything it doesn't
+            # cover is looked up per song, concurrently.
+            tracks = list(item.items())
+            genres = self.get_track_genres(item.mb_albumid)
+            missing = [track.mb_trackid for track in tracks
+                       if track.mb_trackid not in genres]
+            if missing:
+                paths = ['/api/songs/%s' % track_id for track_id in missing]
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    genres.update(zip(missing,
+                                      executor.map(self.get_genre, paths)))
+
+            for track in tracks:
+                genre = genres.get(track.mb_trackid)
+                if genre is not None:
+                    updates.append((track, genre))
+
+        return updates
 
     def imported(self, session, task):
         """Event hook called when an import task finishes."""
         if task.is_album and 'data_source' in task.items[0] and \
            task.items[0].data_source == 'VocaDB':
             self._log.debug("VocaDB: Fetching tags for %s - %s" % (task.album.albumartist, task.album.album))
-            self.add_genre_to_item(task.album, True)
+            updates = self.get_item_genres(task.album, True)
+
+            # Store the album and all its tracks in a single transaction,
+            # opened only once the requests are done.
+            with session.lib.transaction():
+                for item, genre in updates:
+                    item.genre = genre
+                    item.store()
 
 # The UtaiteDB uses the same backend code and is run by the same team as VocaDB
 class UtaiteDBPlugin(VocaDBPlugin):
     def __init__(self):
         super(UtaiteDBPlugin, self).__init__()
-        self.base_url = 'http://utaitedb.net'
+        self.base_url = 'https://utaitedb.net'